@@ -4,12 +4,18 @@ Handles exporting processed data to CSV format.
 """
 
 import csv
-from typing import List, Dict
+import io
+import os
+import tempfile
+from typing import Dict, Iterable, List, Sequence
 
 
 class CSVExporter:
     """Handles CSV export operations."""
     
+    # Buffer size for the underlying binary file (1 MB)
+    _WRITE_BUFFER_SIZE = 1 << 20
+    
     def __init__(self):
         """Initialize the CSV exporter."""
         pass
@@ -28,13 +34,63 @@ class CSVExporter:
         if not data:
             raise ValueError("No data to export")
         
-        # Write data to CSV
-        with open(file_path, 'w', newline='', encoding='utf-8') as csvfile:
-            fieldnames = data[0].keys()
-            writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
+        fieldnames = tuple(data[0].keys())
+        
+        # Plain rows avoid DictWriter's per-row dict handling
+        self._write_csv(file_path, fieldnames, ([row[k] for k in fieldnames] for row in data))
+    
+    def export_columns(self, columns: Dict[str, list], file_path: str) -> None:
+        """Export column-oriented data to a CSV file.
+        
+        Args:
+            columns: Mapping of field name to a list of values, one per row.
+                All lists must have the same length.
+            file_path: Path where the CSV file should be saved
+            
+        Raises:
+            ValueError: If data is empty
+            IOError: If file cannot be written
+        """
+        if not columns:
+            raise ValueError("No data to export")
+        
+        self._write_csv(file_path, columns.keys(), zip(*columns.values()))
+    
+    def _write_csv(self, file_path: str, header: Iterable, rows: Iterable[Sequence]) -> None:
+        """Write a header and rows to a CSV file.
+        
+        The text layer sits on a large binary buffer so writes reach the OS in
+        big chunks; no explicit flush/fsync, the page cache absorbs it. Rows go
+        to a temporary file in the same directory that replaces file_path only
+        once complete, so an interrupted export never leaves a truncated CSV.
+        
+        Args:
+            file_path: Path where the CSV file should be saved
+            header: Field names for the header row
+            rows: Row values, in header order
+        """
+        directory = os.path.dirname(os.path.abspath(file_path))
+        fd, temp_path = tempfile.mkstemp(suffix='.tmp', dir=directory)
+        
+        try:
+            with open(fd, 'wb', buffering=self._WRITE_BUFFER_SIZE) as raw, \
+                    io.TextIOWrapper(raw, encoding='utf-8', newline='', write_through=False) as csvfile:
+                writer = csv.writer(csvfile)
+                
+                writer.writerow(header)
+                writer.writerows(rows)
             
-            writer.writeheader()
-            writer.writerows(data)
+            # mkstemp creates the file owner-only; keep the usual CSV permissions
+            try:
+                mode = os.stat(file_path).st_mode & 0o777
+            except OSError:
+                mode = 0o644
+            os.chmod(temp_path, mode)
+            
+            os.replace(temp_path, file_path)
+        except BaseException:
+            os.unlink(temp_path)
+            raise
     
     def validate_data(self, data: List[Dict]) -> bool:
         """Validate that data is in correct format for export.
@@ -45,20 +101,42 @@ class CSVExporter:
         Returns:
             True if data is valid, False otherwise
         """
-        if not data:
+        if not data or not isinstance(data, list):
             return False
         
-        if not isinstance(data, list):
-            return False
+        # Single pass: every item must be a dict with the same keys as the first.
+        # dict_keys views compare as sets without building new set objects.
+        first_keys = None
+        for item in data:
+            if type(item) is not dict:
+                return False
+            if first_keys is None:
+                first_keys = item.keys()
+            elif item.keys() != first_keys:
+                return False
         
-        # Check that all items are dictionaries
-        if not all(isinstance(item, dict) for item in data):
+        return True
+    
+    def validate_columns(self, columns: Dict[str, list]) -> bool:
+        """Validate that column-oriented data is in correct format for export.
+        
+        Args:
+            columns: Mapping of field name to a list of values
+            
+        Returns:
+            True if every column is a non-empty list of the same length,
+            False otherwise
+        """
+        if not columns or not isinstance(columns, dict):
             return False
         
-        # Check that all dictionaries have the same keys
-        if len(data) > 1:
-            first_keys = set(data[0].keys())
-            if not all(set(item.keys()) == first_keys for item in data[1:]):
+        length = None
+        for values in columns.values():
+            if type(values) is not list:
+                return False
+            if length is None:
+                length = len(values)
+            elif len(values) != length:
                 return False
         
-        return True
+        return length > 0
@@ -4,17 +4,27 @@ Main entry point - composes UI, processor, and exporter modules.
 """
 
 import tkinter as tk
+import multiprocessing
 import os
-from typing import List, Dict
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Callable, List, Dict, Optional
 
 from ui import ImageProcessorUI
-from processor import ImageProcessor
+from processor import ImageProcessor, ResultCache
 from exporter import CSVExporter
 
 
 class ImageProcessorApp:
     """Application controller - orchestrates UI, processor, and exporter."""
     
+    # Maximum number of errors listed in the processing summary dialog
+    _MAX_ERRORS_SHOWN = 10
+    
+    # Minimum time between progress updates posted to the Tk thread (~30 Hz)
+    _PROGRESS_INTERVAL = 0.033
+    
     def __init__(self, root: tk.Tk):
         """Initialize the application.
         
@@ -26,24 +36,35 @@ class ImageProcessorApp:
         # Initialize modules
         self.ui = ImageProcessorUI(root)
         self.processor = ImageProcessor()
+        self.result_cache = ResultCache()
         self.exporter = CSVExporter()
         
         # Application state
         self.selected_files: List[str] = []
-        self.processed_data: List[Dict] = []
+        self.selected_basenames: List[str] = []
+        self.processed_columns: Dict[str, list] = {}
+        
+        # Background processing state
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._closing = False
+        self._last_progress_post = 0.0
         
         # Connect UI callbacks to controller methods
         self.ui.on_select_files = self.handle_select_files
         self.ui.on_process_images = self.handle_process_images
         self.ui.on_export_csv = self.handle_export_csv
         
+        # Stop background work when the window is closed
+        self.root.protocol("WM_DELETE_WINDOW", self.handle_close)
+        
     def handle_select_files(self):
         """Handle file selection from UI."""
         files = self.ui.show_file_dialog()
         
         if files:
-            # Validate files
-            valid_files = [f for f in files if self.processor.validate_image_file(f)]
+            # Validate files - the dialog only returns existing paths, so the
+            # extension check is enough here
+            valid_files = [f for f in files if self.processor.validate_image_extension(f)]
             
             if len(valid_files) != len(files):
                 invalid_count = len(files) - len(valid_files)
@@ -54,10 +75,11 @@ class ImageProcessorApp:
             
             if valid_files:
                 self.selected_files = valid_files
-                self.ui.update_file_list(self.selected_files)
+                self.selected_basenames = [os.path.basename(f) for f in valid_files]
+                self.ui.update_file_list(self.selected_basenames)
                 self.ui.enable_button('process')
                 self.ui.disable_button('export')
-                self.processed_data = []
+                self.processed_columns = {}
                 self.ui.update_status(f"{len(self.selected_files)} files selected")
             else:
                 self.ui.show_warning("No Valid Files", "No valid image files were selected.")
@@ -69,7 +91,7 @@ class ImageProcessorApp:
             return
         
         # Reset processed data
-        self.processed_data = []
+        self.processed_columns = {}
         
         # Setup progress bar
         self.ui.setup_progress_bar(len(self.selected_files))
@@ -79,42 +101,208 @@ class ImageProcessorApp:
         self.ui.disable_button('select')
         self.ui.disable_button('export')
         
-        # Process each file
-        for idx, file_path in enumerate(self.selected_files, 1):
-            filename = os.path.basename(file_path)
-            self.ui.update_status(f"Processing {idx}/{len(self.selected_files)}: {filename}")
+        # Run the batch off the Tk thread so the window stays responsive
+        threading.Thread(target=self._process_worker, daemon=True).start()
+    
+    def _process_worker(self):
+        """Process the selected files on a background thread.
+        
+        All UI updates are marshalled back onto the Tk thread via _post.
+        _process_done is always posted, even if the batch fails unexpectedly.
+        """
+        # One slot per file, filled by index as results arrive
+        results: List[Optional[Dict]] = [None] * len(self.selected_files)
+        errors: List[str] = []
+        
+        try:
+            self._process_batch(results, errors)
+        except Exception as e:
+            errors.append(f"Processing stopped unexpectedly: {str(e)}")
+        finally:
+            self._executor = None
+            
+            # Store results column-wise, in selection order, skipping failures
+            columns: Dict[str, list] = {}
+            for result in results:
+                if result is not None:
+                    for key, value in result.items():
+                        columns.setdefault(key, []).append(value)
+            self.processed_columns = columns
             
-            # Process the image using the processor module
+            self._post(self._process_done, errors)
+    
+    def _process_batch(self, results: List[Optional[Dict]], errors: List[str]):
+        """Run the process pool over the selected files.
+        
+        Args:
+            results: Preallocated list to store each file's result into, by index
+            errors: List to collect per-file error messages into
+        """
+        total = len(self.selected_files)
+        
+        # One timestamp for the whole batch
+        timestamp = time.strftime('%Y-%m-%d %H:%M:%S')
+        
+        # Stat every file once per run; the result feeds both the cache key
+        # and the processor, so no file is stat'ed twice
+        stats = {}
+        for file_path in self.selected_files:
             try:
-                result = self.processor.process_image(file_path)
-                self.processed_data.append(result)
-            except Exception as e:
-                self.ui.show_error("Processing Error", f"Error processing {filename}:\n{str(e)}")
-                # Continue processing other files
+                stats[file_path] = os.stat(file_path)
+            except OSError:
+                pass  # Let the processor report the error
+        
+        # Process files in parallel - each image is independent and CPU-bound.
+        # The default worker count already follows the CPU count (and respects
+        # the Windows limit); spawn avoids forking this threaded Tk process.
+        with ProcessPoolExecutor(mp_context=multiprocessing.get_context('spawn')) as executor:
+            self._executor = executor
+            futures = {}
+            idx = 0
             
-            # Update progress
-            self.ui.update_progress(idx)
+            for i, file_path in enumerate(self.selected_files):
+                if self._closing:
+                    break
+                
+                # Unchanged files are served from the cache instead of the pool
+                st = stats.get(file_path)
+                result = self.result_cache.get(file_path, st) if st else None
+                if result is not None:
+                    idx += 1
+                    results[i] = result
+                    self._report_progress(
+                        idx, total, f"Processed {idx}/{total}: {self.selected_basenames[i]}"
+                    )
+                else:
+                    future = executor.submit(
+                        self.processor.process_image, file_path, timestamp, st
+                    )
+                    futures[future] = i
+            
+            for future in as_completed(futures):
+                # Queued files were cancelled by handle_close; stop collecting
+                if self._closing:
+                    break
+                
+                i = futures[future]
+                idx += 1
+                
+                try:
+                    result = future.result()
+                except Exception as e:
+                    filename = self.selected_basenames[i]
+                    errors.append(f"{filename}: {str(e)}")
+                    self._report_progress(idx, total, f"Failed {idx}/{total}: {filename}")
+                    # Continue processing other files
+                    continue
+                
+                st = stats.get(self.selected_files[i])
+                if st:
+                    self.result_cache.put(self.selected_files[i], st, result)
+                results[i] = result
+                self._report_progress(
+                    idx, total, f"Processed {idx}/{total}: {self.selected_basenames[i]}"
+                )
+    
+    def _report_progress(self, idx: int, total: int, message: str):
+        """Post a combined status and progress update from the worker thread.
         
-        # Re-enable buttons
+        Updates are limited to about 30 per second; the final one of a batch
+        is always posted.
+        
+        Args:
+            idx: Number of files finished so far (1-based)
+            total: Total number of files in the batch
+            message: Status message to display
+        """
+        now = time.monotonic()
+        if idx < total and now - self._last_progress_post < self._PROGRESS_INTERVAL:
+            return
+        
+        self._last_progress_post = now
+        self._post(self._show_progress, idx, message)
+    
+    def _show_progress(self, idx: int, message: str):
+        """Apply a progress update on the Tk thread.
+        
+        Args:
+            idx: Number of files finished so far
+            message: Status message to display
+        """
+        self.ui.update_status(message)
+        self.ui.update_progress(idx)
+    
+    def _post(self, func: Callable, *args):
+        """Run a callback on the Tk thread from a background thread.
+        
+        Posts are dropped once the window is closing or destroyed.
+        
+        Args:
+            func: Callback to run on the Tk thread
+            *args: Arguments for the callback
+        """
+        if self._closing:
+            return
+        
+        try:
+            self.root.after(0, func, *args)
+        except (RuntimeError, tk.TclError):
+            pass  # Window was destroyed in the meantime
+    
+    def _process_done(self, errors: List[str]):
+        """Finish a processing run on the Tk thread.
+        
+        Args:
+            errors: Error messages collected during the run
+        """
+        self._restore_buttons()
+        
+        # Report all failures in one dialog
+        if errors:
+            shown = errors[:self._MAX_ERRORS_SHOWN]
+            if len(errors) > len(shown):
+                shown.append(f"...and {len(errors) - len(shown)} more")
+            self.ui.show_error(
+                "Processing Error",
+                f"{len(errors)} error(s) during processing:\n" + "\n".join(shown)
+            )
+        
+        count = self._processed_count()
+        if count:
+            self.ui.update_status(f"Processing complete! {count} images processed.")
+            self.ui.show_info("Success", f"Successfully processed {count} images!")
+        else:
+            self.ui.update_status("Processing failed - no data extracted.")
+    
+    def _restore_buttons(self):
+        """Set button states to match the current data once a task finishes."""
         self.ui.enable_button('select')
-        self.ui.enable_button('process')
         
-        # Enable export if we have processed data
-        if self.processed_data:
+        if self.selected_files:
+            self.ui.enable_button('process')
+        else:
+            self.ui.disable_button('process')
+        
+        # Export needs processed data
+        if self.processed_columns:
             self.ui.enable_button('export')
-            self.ui.update_status(f"Processing complete! {len(self.processed_data)} images processed.")
-            self.ui.show_info("Success", f"Successfully processed {len(self.processed_data)} images!")
         else:
-            self.ui.update_status("Processing failed - no data extracted.")
+            self.ui.disable_button('export')
+    
+    def _processed_count(self) -> int:
+        """Return the number of processed images currently stored."""
+        for values in self.processed_columns.values():
+            return len(values)
+        return 0
     
     def handle_export_csv(self):
         """Handle CSV export."""
-        if not self.processed_data:
+        if not self.processed_columns:
             self.ui.show_warning("No Data", "Please process images first.")
             return
         
         # Validate data before exporting
-        if not self.exporter.validate_data(self.processed_data):
+        if not self.exporter.validate_columns(self.processed_columns):
             self.ui.show_error("Invalid Data", "Processed data is not in valid format for export.")
             return
         
@@ -124,16 +312,59 @@ class ImageProcessorApp:
         if not file_path:
             return  # User cancelled
         
+        # Write the file off the Tk thread; lock the workflow until it finishes.
+        # Not a daemon thread, so closing the window lets the export complete.
+        self.ui.disable_button('select')
+        self.ui.disable_button('process')
+        self.ui.disable_button('export')
+        self.ui.update_status("Exporting data...")
+        threading.Thread(
+            target=self._export_worker,
+            args=(self.processed_columns, file_path)
+        ).start()
+    
+    def _export_worker(self, columns: Dict[str, list], file_path: str):
+        """Write the CSV file on a background thread.
+        
+        Args:
+            columns: Column-wise processed data to export
+            file_path: Path where the CSV file should be saved
+        """
         try:
             # Export using the exporter module
-            self.exporter.export_to_csv(self.processed_data, file_path)
-            
-            filename = os.path.basename(file_path)
-            self.ui.update_status(f"Data exported to {filename}")
-            self.ui.show_info("Success", f"Data successfully exported to:\n{file_path}")
-            
+            self.exporter.export_columns(columns, file_path)
         except Exception as e:
-            self.ui.show_error("Export Error", f"Failed to export data:\n{str(e)}")
+            self._post(self._export_failed, e)
+        else:
+            self._post(self._export_done, file_path)
+    
+    def _export_done(self, file_path: str):
+        """Finish a successful export on the Tk thread."""
+        self._restore_buttons()
+        
+        filename = os.path.basename(file_path)
+        self.ui.update_status(f"Data exported to {filename}")
+        self.ui.show_info("Success", f"Data successfully exported to:\n{file_path}")
+    
+    def _export_failed(self, error: Exception):
+        """Report a failed export on the Tk thread."""
+        self._restore_buttons()
+        self.ui.update_status("Export failed.")
+        self.ui.show_error("Export Error", f"Failed to export data:\n{str(error)}")
+    
+    def handle_close(self):
+        """Handle the window being closed.
+        
+        Cancels queued image processing so the application exits once the
+        files already being processed finish, rather than after the whole batch.
+        """
+        self._closing = True
+        
+        executor = self._executor
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+        
+        self.root.destroy()
 
 
 def main():
@@ -5,17 +5,35 @@ Handles all image processing logic and data extraction.
 
 import time
 import os
-from typing import Dict
+from collections import OrderedDict
+from typing import Dict, Optional
+
+
+# Output field names - the single source of field (and CSV column) order
+_KEYS = (
+    'filename',
+    'file_path',
+    'file_size_kb',
+    'processed_timestamp',
+    'mock_width',
+    'mock_height',
+    'mock_detected_objects',
+    'mock_confidence_score',
+)
 
 
 class ImageProcessor:
     """Handles image processing operations."""
     
+    # Accepted image file extensions (lowercase, for str.endswith)
+    _VALID_EXT = ('.png', '.jpg', '.jpeg')
+    
     def __init__(self):
         """Initialize the image processor."""
         pass
     
-    def process_image(self, file_path: str) -> Dict:
+    def process_image(self, file_path: str, timestamp: Optional[str] = None,
+                      stat_result: Optional[os.stat_result] = None) -> Dict:
         """Process a single image and extract data.
         
         This is currently a mock implementation. Replace with your actual
@@ -23,28 +41,38 @@ class ImageProcessor:
         
         Args:
             file_path: Path to the image file
+            timestamp: Processing timestamp to record. Pass one shared value
+                when processing a batch; defaults to the current time.
+            stat_result: Existing stat result for the file, to avoid a
+                second stat call; the file is stat'ed if omitted.
             
         Returns:
             Dictionary containing extracted data from the image
         """
+        # Get file information - keep the stat result for further metadata
+        st = stat_result if stat_result is not None else os.stat(file_path)
+        
         # Simulate processing time
         time.sleep(0.5)
         
-        # Get file information
+        if timestamp is None:
+            timestamp = time.strftime('%Y-%m-%d %H:%M:%S')
+        
         filename = os.path.basename(file_path)
-        file_size = os.path.getsize(file_path)
+        file_size = st.st_size
         
         # Mock extracted data - replace this with actual processing
-        extracted_data = {
-            'filename': filename,
-            'file_path': file_path,
-            'file_size_kb': round(file_size / 1024, 2),
-            'processed_timestamp': time.strftime('%Y-%m-%d %H:%M:%S'),
-            'mock_width': 1920,  # Replace with actual image width
-            'mock_height': 1080,  # Replace with actual image height
-            'mock_detected_objects': 'person, car, tree',  # Replace with actual detection
-            'mock_confidence_score': 0.95  # Replace with actual score
-        }
+        # (values are in the same order as _KEYS)
+        extracted_data = dict(zip(_KEYS, (
+            filename,
+            file_path,
+            round(file_size / 1024, 2),
+            timestamp,
+            1920,  # Replace with actual image width
+            1080,  # Replace with actual image height
+            'person, car, tree',  # Replace with actual detection
+            0.95  # Replace with actual score
+        )))
         
         return extracted_data
     
@@ -57,6 +85,65 @@ class ImageProcessor:
         Returns:
             True if valid image file, False otherwise
         """
-        valid_extensions = {'.png', '.jpg', '.jpeg'}
-        file_ext = os.path.splitext(file_path)[1].lower()
-        return file_ext in valid_extensions and os.path.isfile(file_path)
+        return self.validate_image_extension(file_path) and os.path.isfile(file_path)
+    
+    def validate_image_extension(self, file_path: str) -> bool:
+        """Check only the file extension, without touching the filesystem.
+        
+        Use this for paths that are already known to exist, such as those
+        returned by a file dialog.
+        
+        Args:
+            file_path: Path to the file to validate
+            
+        Returns:
+            True if the path has a supported image extension, False otherwise
+        """
+        return file_path.lower().endswith(self._VALID_EXT)
+
+
+class ResultCache:
+    """In-memory LRU cache of processed results.
+    
+    Entries are keyed by (path, mtime, size), so a file that changes on disk
+    is processed again.
+    """
+    
+    def __init__(self, max_size: int = 256):
+        """Initialize the cache.
+        
+        Args:
+            max_size: Maximum number of results to keep
+        """
+        self.max_size = max_size
+        self._entries: "OrderedDict[tuple, Dict]" = OrderedDict()
+    
+    def get(self, file_path: str, st: os.stat_result) -> Optional[Dict]:
+        """Look up the result for a file.
+        
+        Args:
+            file_path: Path to the image file
+            st: Current stat result for the file
+            
+        Returns:
+            The cached result, or None if not cached
+        """
+        key = (file_path, st.st_mtime_ns, st.st_size)
+        result = self._entries.get(key)
+        if result is not None:
+            self._entries.move_to_end(key)
+        return result
+    
+    def put(self, file_path: str, st: os.stat_result, result: Dict) -> None:
+        """Store the result for a file, evicting the oldest entry when full.
+        
+        Args:
+            file_path: Path to the image file
+            st: Stat result the file was processed with
+            result: Result dictionary returned by ImageProcessor.process_image()
+        """
+        key = (file_path, st.st_mtime_ns, st.st_size)
+        self._entries[key] = result
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
@@ -5,13 +5,15 @@ Handles all user interface components and interactions.
 
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
-import os
 from typing import List, Callable, Optional
 
 
 class ImageProcessorUI:
     """Main UI class for the image processor application."""
     
+    # File count label suffixes, indexed by (count == 1)
+    FILES_SUFFIX = ("files selected", "file selected")
+    
     def __init__(self, root: tk.Tk):
         """Initialize the UI.
         
@@ -33,6 +35,7 @@ class ImageProcessorUI:
         self.process_btn = None
         self.export_btn = None
         self.file_listbox = None
+        self._files_var = None
         self.file_count_label = None
         self.progress_bar = None
         self.status_label = None
@@ -40,6 +43,13 @@ class ImageProcessorUI:
         # Create the UI
         self._create_ui()
         
+        # Button lookup for enable_button/disable_button
+        self._buttons = {
+            'select': self.select_btn,
+            'process': self.process_btn,
+            'export': self.export_btn
+        }
+        
     def _create_ui(self):
         """Create all UI components."""
         # Main container with padding
@@ -77,9 +87,11 @@ class ImageProcessorUI:
         scrollbar = ttk.Scrollbar(list_frame)
         scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
         
+        self._files_var = tk.StringVar()
         self.file_listbox = tk.Listbox(
             list_frame,
             height=8,
+            listvariable=self._files_var,
             yscrollcommand=scrollbar.set
         )
         self.file_listbox.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
@@ -179,21 +191,17 @@ class ImageProcessorUI:
         
         return file_path if file_path else ""
     
-    def update_file_list(self, file_paths: List[str]):
+    def update_file_list(self, filenames: List[str]):
         """Update the file listbox with selected files.
         
         Args:
-            file_paths: List of file paths to display
+            filenames: List of file names to display
         """
-        self.file_listbox.delete(0, tk.END)
-        for file_path in file_paths:
-            filename = os.path.basename(file_path)
-            self.file_listbox.insert(tk.END, filename)
-        
-        count = len(file_paths)
-        self.file_count_label.config(
-            text=f"{count} file{'s' if count != 1 else ''} selected"
-        )
+        # Replace the whole list in a single Tk call via the list variable
+        self._files_var.set(tuple(filenames))
+        
+        count = len(filenames)
+        self.file_count_label.config(text=f"{count} {self.FILES_SUFFIX[count == 1]}")
     
     def update_status(self, message: str):
         """Update the status label.
@@ -202,7 +210,6 @@ class ImageProcessorUI:
             message: Status message to display
         """
         self.status_label.config(text=message)
-        self.root.update_idletasks()
     
     def setup_progress_bar(self, maximum: int):
         """Setup the progress bar with a maximum value.
@@ -220,7 +227,6 @@ class ImageProcessorUI:
             value: Current progress value
         """
         self.progress_bar['value'] = value
-        self.root.update_idletasks()
     
     def reset_progress(self):
         """Reset the progress bar to zero."""
@@ -232,14 +238,7 @@ class ImageProcessorUI:
         Args:
             button_name: Name of button ('select', 'process', or 'export')
         """
-        button_map = {
-            'select': self.select_btn,
-            'process': self.process_btn,
-            'export': self.export_btn
-        }
-        
-        if button_name in button_map:
-            button_map[button_name].config(state=tk.NORMAL)
+        self._set_button_state(button_name, tk.NORMAL)
     
     def disable_button(self, button_name: str):
         """Disable a specific button.
@@ -247,14 +246,18 @@ class ImageProcessorUI:
         Args:
             button_name: Name of button ('select', 'process', or 'export')
         """
-        button_map = {
-            'select': self.select_btn,
-            'process': self.process_btn,
-            'export': self.export_btn
-        }
+        self._set_button_state(button_name, tk.DISABLED)
+    
+    def _set_button_state(self, button_name: str, state: str):
+        """Set the state of a button by name, ignoring unknown names.
         
-        if button_name in button_map:
-            button_map[button_name].config(state=tk.DISABLED)
+        Args:
+            button_name: Name of button ('select', 'process', or 'export')
+            state: Tk state to apply (tk.NORMAL or tk.DISABLED)
+        """
+        button = self._buttons.get(button_name)
+        if button is not None:
+            button.config(state=state)
     
     def show_info(self, title: str, message: str):
         """Show an info message box.